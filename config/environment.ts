@@ -52,7 +52,7 @@ export const ENV = {
 
   // Bittensor Configuration
   BITTENSOR_WS_ENDPOINT: process.env.BITTENSOR_WS_ENDPOINT || 'wss://entrypoint-finney.opentensor.ai:443',
-  HOTKEYS_CACHE_TTL_MS: Number(process.env.HOTKEYS_CACHE_TTL_MS) || 5 * 60 * 1000, // 5 minutes
+  HOTKEYS_CACHE_TTL_MS: Number(process.env.HOTKEYS_CACHE_TTL_MS) || 60 * 60 * 1000, // 60 minutes; keep >= the 40-minute validator run interval
 
   // Retry and Timeout Configuration
   MAX_RETRIES: Number(process.env.MAX_RETRIES) || 3,
@@ -65,7 +65,6 @@ export const ENV = {
   POSITION_BATCH_SIZE: Number(process.env.POSITION_BATCH_SIZE) || 100,
   MAX_CONCURRENT_BATCHES: Number(process.env.MAX_CONCURRENT_BATCHES) || 3,
   BATCH_DELAY_MS: Number(process.env.BATCH_DELAY_MS) || 50,
-  HOTKEY_BATCH_SIZE: Number(process.env.HOTKEY_BATCH_SIZE) || 8,
 } as const;
 
 // Supported chain types
@@ -144,7 +143,6 @@ export const CONFIG = {
     POSITION_BATCH_SIZE: ENV.POSITION_BATCH_SIZE,
     MAX_CONCURRENT_BATCHES: ENV.MAX_CONCURRENT_BATCHES,
     BATCH_DELAY_MS: ENV.BATCH_DELAY_MS,
-    HOTKEY_BATCH_SIZE: ENV.HOTKEY_BATCH_SIZE,
   },
 } as const;
 
@@ -0,0 +1,34 @@
+import { describe, it } from 'node:test';
+import assert from 'assert';
+
+import { shouldSkipBurnSubmission } from '../utils/setWeights';
+
+describe('Burn submission skip decision', () => {
+  const activityCutoff = 5000;
+  const currentBlock = 1_000_000;
+
+  it('skips when the row burns only to UID 0 and was updated recently', () => {
+    assert.strictEqual(shouldSkipBurnSubmission([[0, 65535]], currentBlock - 100, activityCutoff, currentBlock), true);
+  });
+
+  it('ignores zero-weight entries alongside the burn UID', () => {
+    assert.strictEqual(shouldSkipBurnSubmission([[0, 65535], [3, 0], [7, 0]], currentBlock - 100, activityCutoff, currentBlock), true);
+  });
+
+  it('submits when the row has other non-zero entries', () => {
+    assert.strictEqual(shouldSkipBurnSubmission([[0, 65535], [5, 120]], currentBlock - 100, activityCutoff, currentBlock), false);
+  });
+
+  it('submits when the only non-zero entry is not the burn UID', () => {
+    assert.strictEqual(shouldSkipBurnSubmission([[4, 65535]], currentBlock - 100, activityCutoff, currentBlock), false);
+  });
+
+  it('submits when the row is empty', () => {
+    assert.strictEqual(shouldSkipBurnSubmission([], currentBlock - 100, activityCutoff, currentBlock), false);
+  });
+
+  it('submits when the last update is half an activity cutoff old or more', () => {
+    assert.strictEqual(shouldSkipBurnSubmission([[0, 65535]], currentBlock - activityCutoff / 2, activityCutoff, currentBlock), false);
+    assert.strictEqual(shouldSkipBurnSubmission([[0, 65535]], 0, activityCutoff, currentBlock), false);
+  });
+});
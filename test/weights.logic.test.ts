@@ -6,6 +6,7 @@ import path from 'path';
 import { calculatePoolwiseNFTEmissions } from '../validator/calculations/emissions';
 import { calculateEmissionsAndRewards, normalizeWeights } from '../validator/calculations/emissions';
 import { calculatePoolWeightsWithReservedPools } from '../utils/poolWeights';
+import { scaleWeightsToU16 } from '../utils/setWeights';
 
 type PoolTickData = { tick: number; subnetId: number };
 
@@ -23,6 +24,22 @@ type ExportedItem = {
   emission: number;
 };
 
+// Production scaling, with the burn UID inserted the same way setWeightsOnSubtensor does
+function scaleMinerWeightsToU16WithBurn(
+  uids: number[],
+  floatWeights: number[],
+  burnUid: number,
+  burnPercentage: number
+): number[] {
+  let burnIdx = uids.indexOf(burnUid);
+  if (burnIdx === -1) {
+    uids.unshift(burnUid);
+    floatWeights.unshift(0);
+    burnIdx = 0;
+  }
+  return scaleWeightsToU16(floatWeights, burnIdx, burnPercentage / 100);
+}
+
 describe('Weight calculation edge cases using exported JSON', () => {
   let items: ExportedItem[];
   let currentTickPerPool: Record<string, PoolTickData>;
@@ -102,86 +119,6 @@ describe('Weight calculation edge cases using exported JSON', () => {
   });
 
   it('submission scaling allocates exact burn and sums to 65535', () => {
-    // Local copy of scaling helper (do not import or modify production file)
-    function scaleMinerWeightsToU16WithBurn(
-      uids: number[],
-      floatWeights: number[],
-      burnUid: number,
-      burnPercentage: number
-    ): number[] {
-      let burnIdx = uids.indexOf(burnUid);
-      if (burnIdx === -1) {
-        uids.unshift(burnUid);
-        floatWeights.unshift(0);
-        burnIdx = 0;
-      }
-      const burnProportion = burnPercentage / 100;
-      const minerIndices = uids.map((_, i) => i).filter(i => i !== burnIdx);
-      const minersCount = minerIndices.length;
-      const minerWeightsSum = minerIndices.reduce((acc, i) => acc + (isFinite(floatWeights[i]) && floatWeights[i] > 0 ? floatWeights[i] : 0), 0);
-      const desiredBurnInt = Math.round(burnProportion * 65535);
-      const minerTotalInt = 65535 - desiredBurnInt;
-      const minerFloatTargets: number[] = minerIndices.map(i => {
-        if (minerTotalInt <= 0) return 0;
-        if (minerWeightsSum <= 0 || !isFinite(minerWeightsSum)) return minerTotalInt / Math.max(minersCount, 1);
-        return (floatWeights[i] / minerWeightsSum) * minerTotalInt;
-      });
-      const minerFloors = minerFloatTargets.map(v => Math.floor(v));
-      const allocatedToMiners = minerFloors.reduce((a, b) => a + b, 0);
-      let minerRemainder = minerTotalInt - allocatedToMiners;
-      if (minerRemainder > 0) {
-        const order = minerFloatTargets
-          .map((v, idx) => ({ idx, frac: v - Math.floor(v) }))
-          .sort((a, b) => b.frac - a.frac)
-          .map(x => x.idx);
-        for (let k = 0; k < minerRemainder && k < order.length; k++) {
-          minerFloors[order[k]] += 1;
-        }
-      }
-      const scaled: number[] = new Array(uids.length).fill(0);
-      scaled[burnIdx] = desiredBurnInt;
-      minerIndices.forEach((uidIdx, j) => { scaled[uidIdx] = minerFloors[j]; });
-      let totalScaled = scaled.reduce((a, b) => a + b, 0);
-      if (totalScaled !== 65535) {
-        let delta = 65535 - totalScaled;
-        if (delta > 0) {
-          if (minersCount > 0) {
-            const order2 = minerFloatTargets
-              .map((v, idx) => ({ idx, v }))
-              .sort((a, b) => b.v - a.v)
-              .map(x => x.idx);
-            let k = 0;
-            while (delta > 0 && minersCount > 0) {
-              const mIdx = order2[k % minersCount];
-              const uidIdx = minerIndices[mIdx];
-              scaled[uidIdx] += 1; delta -= 1; k += 1;
-            }
-          } else {
-            scaled[burnIdx] += delta; delta = 0;
-          }
-        } else if (delta < 0) {
-          let remaining = -delta;
-          if (minersCount > 0) {
-            const order3 = minerIndices
-              .map((uidIdx, j) => ({ j, weight: scaled[uidIdx] }))
-              .sort((a, b) => b.weight - a.weight)
-              .map(x => x.j);
-            let t = 0;
-            while (remaining > 0 && minersCount > 0) {
-              const j = order3[t % minersCount];
-              const uidIdx = minerIndices[j];
-              if (scaled[uidIdx] > 0) { scaled[uidIdx] -= 1; remaining -= 1; }
-              t += 1; if (t > minersCount * 2 && remaining > 0) break;
-            }
-          }
-          if (remaining > 0) {
-            const take = Math.min(remaining, scaled[burnIdx]);
-            scaled[burnIdx] -= take; remaining -= take;
-          }
-        }
-      }
-      return scaled;
-    }
     // Fake per-miner float weights from exported emissions
     const minerWeights: Record<string, number> = {};
     for (const it of items) {
@@ -205,86 +142,6 @@ describe('Weight calculation edge cases using exported JSON', () => {
   });
 
   it('scaling handles various burn percentages (0, 15, 23, 50, 100)', () => {
-    function scaleMinerWeightsToU16WithBurn(
-      uids: number[],
-      floatWeights: number[],
-      burnUid: number,
-      burnPercentage: number
-    ): number[] {
-      let burnIdx = uids.indexOf(burnUid);
-      if (burnIdx === -1) {
-        uids.unshift(burnUid);
-        floatWeights.unshift(0);
-        burnIdx = 0;
-      }
-      const burnProportion = burnPercentage / 100;
-      const minerIndices = uids.map((_, i) => i).filter(i => i !== burnIdx);
-      const minersCount = minerIndices.length;
-      const minerWeightsSum = minerIndices.reduce((acc, i) => acc + (isFinite(floatWeights[i]) && floatWeights[i] > 0 ? floatWeights[i] : 0), 0);
-      const desiredBurnInt = Math.round(burnProportion * 65535);
-      const minerTotalInt = 65535 - desiredBurnInt;
-      const minerFloatTargets: number[] = minerIndices.map(i => {
-        if (minerTotalInt <= 0) return 0;
-        if (minerWeightsSum <= 0 || !isFinite(minerWeightsSum)) return minerTotalInt / Math.max(minersCount, 1);
-        return (floatWeights[i] / minerWeightsSum) * minerTotalInt;
-      });
-      const minerFloors = minerFloatTargets.map(v => Math.floor(v));
-      const allocatedToMiners = minerFloors.reduce((a, b) => a + b, 0);
-      let minerRemainder = minerTotalInt - allocatedToMiners;
-      if (minerRemainder > 0) {
-        const order = minerFloatTargets
-          .map((v, idx) => ({ idx, frac: v - Math.floor(v) }))
-          .sort((a, b) => b.frac - a.frac)
-          .map(x => x.idx);
-        for (let k = 0; k < minerRemainder && k < order.length; k++) {
-          minerFloors[order[k]] += 1;
-        }
-      }
-      const scaled: number[] = new Array(uids.length).fill(0);
-      scaled[burnIdx] = desiredBurnInt;
-      minerIndices.forEach((uidIdx, j) => { scaled[uidIdx] = minerFloors[j]; });
-      let totalScaled = scaled.reduce((a, b) => a + b, 0);
-      if (totalScaled !== 65535) {
-        let delta = 65535 - totalScaled;
-        if (delta > 0) {
-          if (minersCount > 0) {
-            const order2 = minerFloatTargets
-              .map((v, idx) => ({ idx, v }))
-              .sort((a, b) => b.v - a.v)
-              .map(x => x.idx);
-            let k = 0;
-            while (delta > 0 && minersCount > 0) {
-              const mIdx = order2[k % minersCount];
-              const uidIdx = minerIndices[mIdx];
-              scaled[uidIdx] += 1; delta -= 1; k += 1;
-            }
-          } else {
-            scaled[burnIdx] += delta; delta = 0;
-          }
-        } else if (delta < 0) {
-          let remaining = -delta;
-          if (minersCount > 0) {
-            const order3 = minerIndices
-              .map((uidIdx, j) => ({ j, weight: scaled[uidIdx] }))
-              .sort((a, b) => b.weight - a.weight)
-              .map(x => x.j);
-            let t = 0;
-            while (remaining > 0 && minersCount > 0) {
-              const j = order3[t % minersCount];
-              const uidIdx = minerIndices[j];
-              if (scaled[uidIdx] > 0) { scaled[uidIdx] -= 1; remaining -= 1; }
-              t += 1; if (t > minersCount * 2 && remaining > 0) break;
-            }
-          }
-          if (remaining > 0) {
-            const take = Math.min(remaining, scaled[burnIdx]);
-            scaled[burnIdx] -= take; remaining -= take;
-          }
-        }
-      }
-      return scaled;
-    }
-
     const entries = Object.entries(items.reduce<Record<string, number>>((acc, it) => {
       acc[it.miner] = (acc[it.miner] || 0) + it.emission; return acc;
     }, {})).filter(([, w]) => isFinite(w) && w > 0);
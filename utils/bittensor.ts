@@ -1,4 +1,4 @@
-import { ApiPromise, WsProvider, Keyring } from '@polkadot/api';
+import { ApiPromise } from '@polkadot/api';
 import { CONFIG } from '../config/environment';
 import { subtensorClient } from '../validator/api';
 
@@ -8,17 +8,21 @@ const sleep = (ms: number): Promise<void> => new Promise(resolve => setTimeout(r
 const MAX_RETRIES = CONFIG.PERFORMANCE.MAX_RETRIES;
 const INITIAL_RETRY_DELAY = CONFIG.PERFORMANCE.INITIAL_RETRY_DELAY_MS;
 const MAX_RETRY_DELAY = CONFIG.PERFORMANCE.MAX_RETRY_DELAY_MS;
-const BATCH = CONFIG.PERFORMANCE.HOTKEY_BATCH_SIZE;
+const HOTKEYS_CACHE_TTL_MS = CONFIG.BITTENSOR.HOTKEYS_CACHE_TTL_MS;
 
-// Helper function to fetch a single UID's hotkey with retry logic
-const fetchSingleHotkey = async (api: ApiPromise, netuid: number, uid: number): Promise<[string | null, string | null]> => {
+// Last successfully fetched hotkey-to-UID map per netuid
+const hotkeyMapCache = new Map<number, { map: Record<string, number>; fetchedAt: number }>();
+
+// Fetch the hotkeys of all UIDs in [0, total) with one batched storage query, with retry logic
+const fetchHotkeysBatched = async (api: ApiPromise, netuid: number, total: number): Promise<[string[] | null, string | null]> => {
+    const keys = Array.from({ length: total }, (_, uid) => [netuid, uid]);
     let lastError: any = null;
     for (let attempt = 0; attempt <= MAX_RETRIES; attempt++) {
         try {
             // eslint-disable-next-line @typescript-eslint/ban-ts-comment
             // @ts-ignore
-            const acc: any = await api.query.subtensorModule.keys(netuid, uid);
-            return [acc.toString(), null];
+            const accounts: any[] = await api.query.subtensorModule.keys.multi(keys);
+            return [accounts.map(acc => acc.toString()), null];
         } catch (error) {
             lastError = error;
             if (attempt < MAX_RETRIES) {
@@ -27,12 +31,37 @@ const fetchSingleHotkey = async (api: ApiPromise, netuid: number, uid: number):
             }
         }
     }
-    return [null, `Failed to fetch hotkey for UID ${uid} after ${MAX_RETRIES + 1} attempts: ${lastError?.message || 'Unknown error'}`];
+    return [null, `Failed to fetch hotkeys for ${total} UIDs after ${MAX_RETRIES + 1} attempts: ${lastError?.message || 'Unknown error'}`];
 };
 
+/**
+ * Get the hotkey-to-UID map for a subnet, served from cache while it is younger
+ * than HOTKEYS_CACHE_TTL_MS. On a failed refresh the last good map is returned
+ * together with the refresh error, so callers can still use it but see the failure.
+ */
 export async function getHotkeyToUidMap(
   wsUrl: string,
   netuid: number
+): Promise<[Record<string, number>, string | null]> {
+  const cached = hotkeyMapCache.get(netuid);
+  if (cached && Date.now() - cached.fetchedAt < HOTKEYS_CACHE_TTL_MS) {
+    return [{ ...cached.map }, null];
+  }
+
+  const [hotkeyToUid, error] = await fetchHotkeyToUidMap(wsUrl, netuid);
+  if (!error) {
+    hotkeyMapCache.set(netuid, { map: hotkeyToUid, fetchedAt: Date.now() });
+    return [{ ...hotkeyToUid }, null];
+  }
+  if (cached) {
+    return [{ ...cached.map }, `${error} (using cached map from ${new Date(cached.fetchedAt).toISOString()})`];
+  }
+  return [hotkeyToUid, error];
+}
+
+async function fetchHotkeyToUidMap(
+  wsUrl: string,
+  netuid: number
 ): Promise<[Record<string, number>, string | null]> {
   try {
     // Initialize the singleton client if needed
@@ -47,30 +76,14 @@ export async function getHotkeyToUidMap(
     if (total === 0) {
       return [{}, null];
     }
-    const hotkeyToUid: Record<string, number> = {};
-    const failedUIDs: number[] = [];
-    for (let start = 0; start < total; start += BATCH) {
-      const batchEnd = Math.min(start + BATCH, total);
-      const tasks: Promise<void>[] = [];
-      for (let uid = start; uid < batchEnd; uid++) {
-        tasks.push(
-          (async () => {
-            const [hotkey, error] = await fetchSingleHotkey(api, netuid, uid);
-            if (hotkey) {
-              hotkeyToUid[hotkey] = uid;
-            } else {
-              failedUIDs.push(uid);
-              console.error(`Failed to fetch hotkey for UID ${uid}:`, error);
-            }
-          })()
-        );
-      }
-      await Promise.all(tasks);
-    }
-    
-    if (failedUIDs.length > 0) {
-      return [hotkeyToUid, `${failedUIDs.length} UIDs failed to fetch`];
+    const [hotkeys, error] = await fetchHotkeysBatched(api, netuid, total);
+    if (!hotkeys) {
+      return [{}, error];
     }
+    const hotkeyToUid: Record<string, number> = {};
+    hotkeys.forEach((hotkey, uid) => {
+      hotkeyToUid[hotkey] = uid;
+    });
     return [hotkeyToUid, null];
   } catch (error: any) {
     return [{}, `Failed to fetch hotkey/uid map: ${error.message}`];
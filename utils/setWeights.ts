@@ -1,9 +1,24 @@
-import { ApiPromise, WsProvider, Keyring } from '@polkadot/api';
-import { CONFIG } from '../config/environment';
+import { ApiPromise, Keyring } from '@polkadot/api';
 import { subtensorClient } from '../validator/api';
 import fs from 'fs';
 import path from 'path';
 
+// Maximum on-chain weight value; weights are submitted as u16 units summing to this
+const U16_MAX = 65535;
+
+type HotkeyPair = ReturnType<Keyring['addFromUri']>;
+
+// Hotkey pair derived once per URI; sr25519 derivation from a mnemonic is not free
+let cachedHotkey: { uri: string; pair: HotkeyPair } | null = null;
+
+function getHotkeyPair(hotkeyUri: string): HotkeyPair {
+  if (!cachedHotkey || cachedHotkey.uri !== hotkeyUri) {
+    const keyring = new Keyring({ type: 'sr25519' });
+    cachedHotkey = { uri: hotkeyUri, pair: keyring.addFromUri(hotkeyUri) };
+  }
+  return cachedHotkey.pair;
+}
+
 export async function setWeightsOnSubtensor(
   wsUrl: string,
   hotkeyUri: string,
@@ -16,8 +31,7 @@ export async function setWeightsOnSubtensor(
     await subtensorClient.initialize(wsUrl);
     const api = subtensorClient.getAPI();
     
-    const keyring = new Keyring({ type: 'sr25519' });
-    const hotkey = keyring.addFromUri(hotkeyUri);
+    const hotkey = getHotkeyPair(hotkeyUri);
 
     // Map addresses to UIDs; filter unknown addresses
     const entries = Object.entries(weights).filter(([addr]) => addressToUid[addr] !== undefined);
@@ -68,103 +82,18 @@ export async function setWeightsOnSubtensor(
       burnIdx = 0;
     }
 
-    const burnProportion = burnPercentage / 100;
-    const minerProportion = 1 - burnProportion;
-
-    const minerIndices = uids.map((_, i) => i).filter(i => i !== burnIdx);
-    const minersCount = minerIndices.length;
-    const minerWeightsSum = minerIndices.reduce((acc, i) => acc + (isFinite(floatWeights[i]) && floatWeights[i] > 0 ? floatWeights[i] : 0), 0);
-
-    // If all weights are zero, submit all zeros (including burn UID)
+    // If all weights are zero, submit all zeros (including burn UID); there is nothing to normalize
     const allWeightsZero = floatWeights.every(w => w === 0);
-    
-    const desiredBurnInt = allWeightsZero ? 0 : Math.round(burnProportion * 65535);
-    const minerTotalInt = allWeightsZero ? 0 : (65535 - desiredBurnInt);
-
-    const minerFloatTargets: number[] = minerIndices.map(i => {
-      if (allWeightsZero) return 0;
-      if (minerTotalInt <= 0) return 0;
-      if (minerWeightsSum <= 0 || !isFinite(minerWeightsSum)) return 0; // Don't distribute if no valid weights
-      return (floatWeights[i] / minerWeightsSum) * minerTotalInt;
-    });
-
-    const minerFloors = minerFloatTargets.map(v => Math.floor(v));
-    let allocatedToMiners = minerFloors.reduce((a, b) => a + b, 0);
-    let minerRemainder = minerTotalInt - allocatedToMiners; // >= 0
-
-    if (minerRemainder > 0) {
-      const order = minerFloatTargets
-        .map((v, idx) => ({ idx, frac: v - Math.floor(v) }))
-        .sort((a, b) => b.frac - a.frac)
-        .map(x => x.idx);
-      for (let k = 0; k < minerRemainder && k < order.length; k++) {
-        minerFloors[order[k]] += 1;
-      }
-    }
-
-    const scaled: number[] = new Array(uids.length).fill(0);
-    scaled[burnIdx] = desiredBurnInt;
-    minerIndices.forEach((uidIdx, j) => {
-      scaled[uidIdx] = minerFloors[j];
-    });
-
-    let totalScaled = scaled.reduce((a, b) => a + b, 0);
-    // If all weights are zero, skip distribution and keep all at zero
+    let scaled: number[];
     if (allWeightsZero) {
-      // All weights are intentionally zero, so totalScaled should be 0
-      // Don't distribute the remaining 65535
+      scaled = new Array(uids.length).fill(0);
       console.log('All weights are zero. Submitting zero weights for all UIDs (total: 0).');
-    } else if (totalScaled !== 65535) {
-      let delta = 65535 - totalScaled; // positive => need to add, negative => need to remove
-      if (delta > 0) {
-        if (minersCount > 0) {
-          const order2 = minerFloatTargets
-            .map((v, idx) => ({ idx, v }))
-            .sort((a, b) => b.v - a.v)
-            .map(x => x.idx);
-          let k = 0;
-          while (delta > 0 && minersCount > 0) {
-            const mIdx = order2[k % minersCount];
-            const uidIdx = minerIndices[mIdx];
-            scaled[uidIdx] += 1;
-            delta -= 1;
-            k += 1;
-          }
-        } else {
-          scaled[burnIdx] += delta;
-          delta = 0;
-        }
-      } else if (delta < 0) {
-        let remaining = -delta;
-        if (minersCount > 0) {
-          const order3 = minerIndices
-            .map((uidIdx, j) => ({ j, weight: scaled[uidIdx] }))
-            .sort((a, b) => b.weight - a.weight)
-            .map(x => x.j);
-          let t = 0;
-          while (remaining > 0 && minersCount > 0) {
-            const j = order3[t % minersCount];
-            const uidIdx = minerIndices[j];
-            if (scaled[uidIdx] > 0) {
-              scaled[uidIdx] -= 1;
-              remaining -= 1;
-            }
-            t += 1;
-            if (t > minersCount * 2 && remaining > 0) break;
-          }
-        }
-        if (remaining > 0) {
-          const take = Math.min(remaining, scaled[burnIdx]);
-          scaled[burnIdx] -= take;
-          remaining -= take;
-        }
-      }
-      totalScaled = scaled.reduce((a, b) => a + b, 0);
+    } else {
+      scaled = scaleWeightsToU16(floatWeights, burnIdx, burnPercentage / 100);
     }
 
     // Get current block number as version key
-    const header = await api.rpc.chain.getHeader();
-    const versionKey = header.number.toNumber();
+    const versionKey = await getVersionKey(api);
 
     console.log('Setting weights on network...');
     console.log('UIDs:', uids);
@@ -173,26 +102,180 @@ export async function setWeightsOnSubtensor(
     
     const burnUnits = scaled[uids.indexOf(0)];
     if (burnPercentage > 0) {
-      console.log(`Burn UID 0 units: ${burnUnits} (~${((burnUnits / 65535) * 100).toFixed(4)}%), target: ${burnPercentage}%`);
+      console.log(`Burn UID 0 units: ${burnUnits} (~${((burnUnits / U16_MAX) * 100).toFixed(4)}%), target: ${burnPercentage}%`);
     } else {
       console.log('Burn disabled (0%). No units allocated to UID 0.');
     }
     console.log('Version key:', versionKey);
 
     // Submit extrinsic
-    const tx = api.tx.subtensorModule.setWeights(netuid, uids, scaled, versionKey);
-    const hash = await tx.signAndSend(hotkey);
-    console.log('Weights set with tx hash:', hash.toHex());
-    
-    // Save weight details to JSON file after successful transaction
-    await saveWeightDetails(uids, scaled, hash.toHex(), versionKey);
-    
+    const txHash = await submitWeights(api, hotkey, netuid, uids, scaled, versionKey);
+    console.log('Weights set with tx hash:', txHash);
+
   } catch (err) {
     console.error('Error submitting weights:', err);
     throw err;
   }
 }
 
+/**
+ * Scale non-negative float weights to u16 units summing to 65535. `burnProportion` of the
+ * total goes to `burnIdx`; the remainder is split across the other entries via largest-remainder.
+ */
+export function scaleWeightsToU16(
+  floatWeights: number[],
+  burnIdx: number,
+  burnProportion: number
+): number[] {
+  const minerIndices = floatWeights.map((_, i) => i).filter(i => i !== burnIdx);
+  const minersCount = minerIndices.length;
+  const minerWeightsSum = minerIndices.reduce((acc, i) => acc + (isFinite(floatWeights[i]) && floatWeights[i] > 0 ? floatWeights[i] : 0), 0);
+
+  const desiredBurnInt = Math.round(burnProportion * U16_MAX);
+  const minerTotalInt = U16_MAX - desiredBurnInt;
+
+  const minerFloatTargets: number[] = minerIndices.map(i => {
+    if (minerTotalInt <= 0) return 0;
+    if (minerWeightsSum <= 0 || !isFinite(minerWeightsSum)) return 0; // Don't distribute if no valid weights
+    return (floatWeights[i] / minerWeightsSum) * minerTotalInt;
+  });
+
+  const minerFloors = minerFloatTargets.map(v => Math.floor(v));
+  let allocatedToMiners = minerFloors.reduce((a, b) => a + b, 0);
+  let minerRemainder = minerTotalInt - allocatedToMiners; // >= 0
+
+  if (minerRemainder > 0) {
+    const order = minerFloatTargets
+      .map((v, idx) => ({ idx, frac: v - Math.floor(v) }))
+      .sort((a, b) => b.frac - a.frac)
+      .map(x => x.idx);
+    for (let k = 0; k < minerRemainder && k < order.length; k++) {
+      minerFloors[order[k]] += 1;
+    }
+  }
+
+  const scaled: number[] = new Array(floatWeights.length).fill(0);
+  scaled[burnIdx] = desiredBurnInt;
+  minerIndices.forEach((uidIdx, j) => {
+    scaled[uidIdx] = minerFloors[j];
+  });
+
+  const totalScaled = scaled.reduce((a, b) => a + b, 0);
+  if (totalScaled !== U16_MAX) {
+    let delta = U16_MAX - totalScaled; // positive => need to add, negative => need to remove
+    if (delta > 0) {
+      if (minersCount > 0) {
+        const order2 = minerFloatTargets
+          .map((v, idx) => ({ idx, v }))
+          .sort((a, b) => b.v - a.v)
+          .map(x => x.idx);
+        let k = 0;
+        while (delta > 0 && minersCount > 0) {
+          const mIdx = order2[k % minersCount];
+          const uidIdx = minerIndices[mIdx];
+          scaled[uidIdx] += 1;
+          delta -= 1;
+          k += 1;
+        }
+      } else {
+        scaled[burnIdx] += delta;
+        delta = 0;
+      }
+    } else if (delta < 0) {
+      let remaining = -delta;
+      if (minersCount > 0) {
+        const order3 = minerIndices
+          .map((uidIdx, j) => ({ j, weight: scaled[uidIdx] }))
+          .sort((a, b) => b.weight - a.weight)
+          .map(x => x.j);
+        let t = 0;
+        while (remaining > 0 && minersCount > 0) {
+          const j = order3[t % minersCount];
+          const uidIdx = minerIndices[j];
+          if (scaled[uidIdx] > 0) {
+            scaled[uidIdx] -= 1;
+            remaining -= 1;
+          }
+          t += 1;
+          if (t > minersCount * 2 && remaining > 0) break;
+        }
+      }
+      if (remaining > 0) {
+        const take = Math.min(remaining, scaled[burnIdx]);
+        scaled[burnIdx] -= take;
+        remaining -= take;
+      }
+    }
+  }
+
+  return scaled;
+}
+
+/**
+ * Decide whether a burn submission can be skipped: the validator's on-chain weights row
+ * puts non-zero weight only on `burnUid`, and was last updated less than half an activity
+ * cutoff before `currentBlock` (so skipping can't let the validator go inactive)
+ */
+export function shouldSkipBurnSubmission(
+  weightsRow: Array<[number, number]>,
+  lastUpdateBlock: number,
+  activityCutoff: number,
+  currentBlock: number,
+  burnUid: number = 0
+): boolean {
+  const nonZero = weightsRow.filter(([, w]) => Number(w) > 0);
+  if (nonZero.length !== 1 || Number(nonZero[0][0]) !== burnUid) {
+    return false;
+  }
+  return currentBlock - lastUpdateBlock < activityCutoff / 2;
+}
+
+/**
+ * Read the validator's weights row, last update and the subnet activity cutoff from chain
+ * and apply shouldSkipBurnSubmission. `validatorUid` may come from a cached hotkey map, so
+ * it is only trusted if the chain still maps it to `hotkeyAddress`.
+ */
+async function burnWeightsUpToDate(
+  api: ApiPromise,
+  netuid: number,
+  validatorUid: number,
+  hotkeyAddress: string,
+  burnUid: number,
+  currentBlock: number
+): Promise<boolean> {
+  try {
+    const [owner, weights, lastUpdate, activityCutoff]: any[] = await Promise.all([
+      // eslint-disable-next-line @typescript-eslint/ban-ts-comment
+      // @ts-ignore
+      api.query.subtensorModule.keys(netuid, validatorUid),
+      // eslint-disable-next-line @typescript-eslint/ban-ts-comment
+      // @ts-ignore
+      api.query.subtensorModule.weights(netuid, validatorUid),
+      // eslint-disable-next-line @typescript-eslint/ban-ts-comment
+      // @ts-ignore
+      api.query.subtensorModule.lastUpdate(netuid),
+      // eslint-disable-next-line @typescript-eslint/ban-ts-comment
+      // @ts-ignore
+      api.query.subtensorModule.activityCutoff(netuid),
+    ]);
+
+    if (owner.toString() !== hotkeyAddress) {
+      return false;
+    }
+
+    return shouldSkipBurnSubmission(
+      weights.toJSON() as [number, number][],
+      Number((lastUpdate.toJSON() as number[])[validatorUid] ?? 0),
+      Number(activityCutoff.toString()),
+      currentBlock,
+      burnUid
+    );
+  } catch (error: any) {
+    console.warn(`Could not read on-chain weights, submitting anyway: ${error?.message || String(error)}`);
+    return false;
+  }
+}
+
 /**
  * Burn 100% of miner emissions by sending all weight to UID 0 (burn address)
  */
@@ -207,8 +290,7 @@ export async function burnAllWeightsOnSubtensor(
     await subtensorClient.initialize(wsUrl);
     const api = subtensorClient.getAPI();
     
-    const keyring = new Keyring({ type: 'sr25519' });
-    const hotkey = keyring.addFromUri(hotkeyUri);
+    const hotkey = getHotkeyPair(hotkeyUri);
 
     // Get all UIDs
     const uids = Object.values(addressToUid);
@@ -225,36 +307,87 @@ export async function burnAllWeightsOnSubtensor(
 
     // Allocate 100% to burn UID (65535 units)
     const scaled: number[] = new Array(uids.length).fill(0);
-    scaled[burnIdx] = 65535;
+    scaled[burnIdx] = U16_MAX;
 
     // Get current block number as version key
-    const header = await api.rpc.chain.getHeader();
-    const versionKey = header.number.toNumber();
+    const versionKey = await getVersionKey(api);
+
+    // Skip the extrinsic if the chain already holds the same burn weights from this validator
+    const validatorUid = addressToUid[hotkey.address];
+    if (validatorUid !== undefined && await burnWeightsUpToDate(api, netuid, validatorUid, hotkey.address, 0, versionKey)) {
+      console.log(`On-chain weights for validator UID ${validatorUid} already burn 100% to UID 0, skipping submission.`);
+      return;
+    }
 
     console.log('Burning 100% of weights (all to UID 0)...');
     console.log('UIDs:', uids);
     console.log('Scaled weights:', scaled);
-    console.log('Burn UID 0 units: 65535 (100%)');
+    console.log(`Burn UID 0 units: ${U16_MAX} (100%)`);
     console.log('Version key:', versionKey);
 
     // Submit extrinsic
-    const tx = api.tx.subtensorModule.setWeights(netuid, uids, scaled, versionKey);
-    const hash = await tx.signAndSend(hotkey);
-    console.log('Weights burned with tx hash:', hash.toHex());
-    
-    // Save weight details to JSON file after successful transaction
-    await saveWeightDetails(uids, scaled, hash.toHex(), versionKey);
-    
+    const txHash = await submitWeights(api, hotkey, netuid, uids, scaled, versionKey);
+    console.log('Weights burned with tx hash:', txHash);
+
   } catch (err) {
     console.error('Error burning weights:', err);
     throw err;
   }
 }
 
+/**
+ * Current block number, used as the weights version key
+ */
+async function getVersionKey(api: ApiPromise): Promise<number> {
+  const header = await api.rpc.chain.getHeader();
+  return header.number.toNumber();
+}
+
+/**
+ * Sign and submit a setWeights extrinsic, then queue its weight history record.
+ * Returns the tx hash.
+ */
+async function submitWeights(
+  api: ApiPromise,
+  hotkey: HotkeyPair,
+  netuid: number,
+  uids: number[],
+  scaled: number[],
+  versionKey: number
+): Promise<string> {
+  const tx = api.tx.subtensorModule.setWeights(netuid, uids, scaled, versionKey);
+  const hash = await tx.signAndSend(hotkey);
+  const txHash = hash.toHex();
+
+  // Save weight details to JSON file in the background; the submission doesn't wait on disk I/O
+  void saveWeightDetails(uids, scaled, txHash, versionKey);
+  return txHash;
+}
+
+// Serializes history writes so overlapping submissions can't drop each other's records
+let weightHistoryQueue: Promise<void> = Promise.resolve();
+
+/**
+ * Wait for queued weight history writes to finish (call before exiting)
+ */
+export function flushWeightHistory(): Promise<void> {
+  return weightHistoryQueue;
+}
+
 /**
  * Save weight details to JSON file after successful transaction
  */
-async function saveWeightDetails(
+function saveWeightDetails(
+  uids: number[],
+  weights: number[],
+  txHash: string,
+  versionKey: number
+): Promise<void> {
+  weightHistoryQueue = weightHistoryQueue.then(() => writeWeightDetails(uids, weights, txHash, versionKey));
+  return weightHistoryQueue;
+}
+
+async function writeWeightDetails(
   uids: number[],
   weights: number[],
   txHash: string,
@@ -263,9 +396,7 @@ async function saveWeightDetails(
   try {
     // Create weights directory if it doesn't exist
     const weightsDir = path.join(process.cwd(), 'weights');
-    if (!fs.existsSync(weightsDir)) {
-      fs.mkdirSync(weightsDir, { recursive: true });
-    }
+    await fs.promises.mkdir(weightsDir, { recursive: true });
 
     // Create weight details object in UID: WEIGHT format
     const weightDetails: Record<string, number> = {};
@@ -287,9 +418,14 @@ async function saveWeightDetails(
 
     // Read existing data or initialize empty array
     let existingData: any[] = [];
-    if (fs.existsSync(filepath)) {
+    let fileContent: string | null = null;
+    try {
+      fileContent = await fs.promises.readFile(filepath, 'utf8');
+    } catch (readError: any) {
+      if (readError?.code !== 'ENOENT') throw readError;
+    }
+    if (fileContent !== null) {
       try {
-        const fileContent = fs.readFileSync(filepath, 'utf8');
         existingData = JSON.parse(fileContent);
         if (!Array.isArray(existingData)) {
           existingData = [];
@@ -304,7 +440,7 @@ async function saveWeightDetails(
     existingData.push(weightRecord);
 
     // Write updated data back to file
-    fs.writeFileSync(filepath, JSON.stringify(existingData, null, 2));
+    await fs.promises.writeFile(filepath, JSON.stringify(existingData, null, 2));
     console.log(`Weight details appended to: ${filepath}`);
     console.log(`Total weight records: ${existingData.length}`);
 
@@ -7,7 +7,7 @@
 // Entry point for the BitTensor Subnet Validator
 import { logger } from '../utils/logger';
 import { CONFIG } from '../config/environment';
-import { setWeightsOnSubtensor, burnAllWeightsOnSubtensor } from '../utils/setWeights';
+import { setWeightsOnSubtensor, burnAllWeightsOnSubtensor, flushWeightHistory } from '../utils/setWeights';
 import { getHotkeyToUidMap } from '../utils/bittensor';
 import { calculatePoolWeightsWithReservedPools } from '../utils/poolWeights';
 import { getAllNFTPositions, getCurrentTickPerPool, listActivePools } from './chains';
@@ -183,8 +183,9 @@ async function runValidatorWithEmissions() {
 
 /**
  * Main validator function: Redirects 100% of emissions to UID 0 (burn)
+ * Resolves to whether the run succeeded.
  */
-async function runValidator() {
+async function runValidator(): Promise<boolean> {
   logger.info('Starting validator run (100% burn mode)...');
   
   try {
@@ -206,44 +207,80 @@ async function runValidator() {
     logger.info('Burning 100% of emissions (all weight to UID 0)...');
     await burnAllWeightsOnSubtensor(wsUrl, hotkeyUri, netuid, hotkeyToUid || {});
     logger.info('Validator run complete (100% burn).');
+    // A failed hotkey map refresh counts as a failed run so it is retried with backoff
+    return !mapError;
 
   } catch (error) {
     logger.error('Error in validator run:', error);
+    return false;
   }
 }
 
 // Graceful shutdown handler
 process.on('SIGINT', async () => {
   logger.info('Received SIGINT, shutting down gracefully...');
+  await flushWeightHistory();
   await subtensorClient.shutdown();
   process.exit(0);
 });
 
 process.on('SIGTERM', async () => {
   logger.info('Received SIGTERM, shutting down gracefully...');
+  await flushWeightHistory();
   await subtensorClient.shutdown();
   process.exit(0);
 });
 
+// Stray rejections (e.g. from provider callbacks) may leave the API in a broken state:
+// record them, flush pending weight history and exit so the container restart policy recovers
+process.on('unhandledRejection', async (reason) => {
+  logger.error('Unhandled promise rejection, exiting:', reason);
+  await flushWeightHistory();
+  process.exit(1);
+});
+
+// Fixed interval of 40 minutes between validator run starts
+const RUN_INTERVAL_MINUTES = 40;
+const RUN_INTERVAL_MS = RUN_INTERVAL_MINUTES * 60 * 1000;
+
+// Failed runs are retried after 30s, doubling per consecutive failure, but never later than the regular interval
+const RUN_RETRY_BASE_DELAY_MS = 30 * 1000;
+let consecutiveFailures = 0;
+
 /**
- * Schedule the next validator run with a fixed interval of 40 minutes
+ * Schedule the next validator run one interval after the previous run started,
+ * so time spent inside a run doesn't push every later run back.
+ * After a failed run, retry sooner with exponential backoff.
  */
-function scheduleNextRun(): void {
-  // Fixed interval of 40 minutes (in milliseconds)
-  const intervalMinutes = 40;
-  const intervalMs = intervalMinutes * 60 * 1000;
-  
-  const nextRunDate = new Date(Date.now() + intervalMs);
-  logger.info(`Next validator run scheduled in ${intervalMinutes} minutes (at ${nextRunDate.toISOString()})`);
-  
-  setTimeout(() => {
-    runValidator().finally(() => {
-      scheduleNextRun();
+function scheduleNextRun(lastRunStartedAt: number, succeeded: boolean): void {
+  const nextRunAt = lastRunStartedAt + RUN_INTERVAL_MS;
+  let delayMs = Math.max(0, nextRunAt - Date.now());
+
+  if (succeeded) {
+    consecutiveFailures = 0;
+  } else {
+    consecutiveFailures++;
+    const retryDelayMs = RUN_RETRY_BASE_DELAY_MS * Math.pow(2, consecutiveFailures - 1);
+    delayMs = Math.min(delayMs, retryDelayMs);
+    logger.warn(`Validator run failed (${consecutiveFailures} in a row), retrying with backoff`);
+  }
+
+  logger.info(`Next validator run scheduled in ${(delayMs / 60000).toFixed(1)} minutes (at ${new Date(Date.now() + delayMs).toISOString()})`);
+
+  setTimeout(startRun, delayMs);
+}
+
+function startRun(): void {
+  const startedAt = Date.now();
+  runValidator()
+    .catch((error) => {
+      logger.error('Unexpected error in validator run:', error);
+      return false;
+    })
+    .then((succeeded) => {
+      scheduleNextRun(startedAt, succeeded);
     });
-  }, intervalMs);
 }
 
 // Start the validator and schedule subsequent runs with fixed 40-minute intervals
-runValidator().finally(() => {
-  scheduleNextRun();
-});
\ No newline at end of file
+startRun();
\ No newline at end of file